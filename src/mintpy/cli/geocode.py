@@ -9,6 +9,7 @@
 import math
 import os
 import sys
+from functools import lru_cache
 
 from mintpy.defaults.template import get_template_content
 from mintpy.utils import arg_utils
@@ -88,6 +89,11 @@ def create_parser(subparsers=None):
     interp.add_argument('--software', dest='software', default='pyresample', choices={'pyresample', 'scipy'},
                         help='software/module used for interpolation (default: %(default)s)\n'
                              'Note: --bbox is not supported for -p scipy')
+    interp.add_argument('--num-worker', dest='numWorker', type=int, default=1,
+                        help='number of input files to geocode in parallel (default: %(default)s).')
+    interp.add_argument('--gpu', dest='gpu', action='store_true',
+                        help='run the resampling kernels on the GPU via cupy (requires cupy;\n'
+                             'recommended for large output grids only).')
 
     parser.add_argument('--update', dest='updateMode', action='store_true',
                         help='skip resampling if output file exists and newer than input file')
@@ -182,14 +188,27 @@ def cmd_line_parse(iargs=None):
     return inps
 
 
+@lru_cache(maxsize=8)
+def _read_template_cached(template_file, mtime):
+    """Read the template file into a dict, memoized on (path, mtime).
+
+    The mtime argument is part of the cache key only, so that an edited template
+    file is re-parsed. Repeated calls with the same unchanged file, e.g. when
+    geocode is driven as a library over many runs, skip the re-tokenization.
+    """
+    from mintpy.utils import readfile
+    return readfile.read_template(template_file, skip_chars=['[', ']'])
+
+
 def read_template2inps(template_file, inps):
     """Read input template options into Namespace inps"""
     print('read input option from template file:', template_file)
 
-    from mintpy.utils import readfile, utils as ut
+    from mintpy.utils import utils as ut
 
     iDict = vars(inps)
-    template = readfile.read_template(template_file, skip_chars=['[', ']'])
+    # copy to keep the cached dict pristine
+    template = dict(_read_template_cached(template_file, os.path.getmtime(template_file)))
     template = ut.check_template_auto_value(template)
 
     key_prefix = 'mintpy.geocode.'
@@ -6,7 +6,9 @@
 
 
 import os
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -33,6 +35,190 @@ def auto_output_filename(in_file, inps):
     return out_file
 
 
+def geocode_file(infile, inps, res_obj, ref_latlon_cache=None):
+    """Geocode one input file using the prepared resample object.
+
+    Parameters: infile           - str, path of the file to be resampled
+                inps             - namespace, input options
+                res_obj          - mintpy.objects.resample.resample object
+                ref_latlon_cache - dict, cache of REF_Y/X --> REF_LAT/LON conversions
+                                   shared among the input files
+    Returns:    outfile          - str, path of the output file
+    """
+    ref_latlon_cache = {} if ref_latlon_cache is None else ref_latlon_cache
+
+    print('-' * 50+f'\nresampling file: {infile}')
+    atr = readfile.read_attribute(infile, datasetName=inps.dset)
+    outfile = auto_output_filename(infile, inps)
+
+    # update_mode
+    if inps.updateMode:
+        print('update mode: ON')
+        if ut.run_or_skip(outfile, in_file=[infile, inps.lookupFile]) == 'skip':
+            return outfile
+
+    # fast path: input file already on the requested output grid
+    # (e.g. pipelines that re-run geocoding on already-geocoded products):
+    # copy the file instead of resampling it, which costs nothing and avoids
+    # degrading the data through another round of interpolation
+    # [skip if a subset of datasets is requested (--dset), as the copy would
+    # carry all datasets of the input file]
+    if (inps.dset is None
+            and inps.radar2geo
+            and all(key in atr.keys() for key in ['Y_FIRST', 'X_FIRST', 'Y_STEP', 'X_STEP'])):
+        y_step, x_step = res_obj.lalo_step
+        if (int(atr['LENGTH']) == res_obj.length
+                and int(atr['WIDTH']) == res_obj.width
+                and abs(float(atr['Y_FIRST']) - res_obj.SNWE[1]) < abs(y_step) * 1e-3
+                and abs(float(atr['X_FIRST']) - res_obj.SNWE[2]) < abs(x_step) * 1e-3
+                and abs(float(atr['Y_STEP']) - y_step) < abs(y_step) * 1e-3
+                and abs(float(atr['X_STEP']) - x_step) < abs(x_step) * 1e-3):
+            print('input file is already on the requested output grid, skip resampling')
+            if os.path.abspath(infile) != os.path.abspath(outfile):
+                # copy (not hard link): output attributes are routinely edited
+                # in place downstream, which must not mutate the input file
+                shutil.copy2(infile, outfile)
+                print(f'copy {infile} --> {outfile}')
+            return outfile
+
+    ## prepare output
+    # update metadata
+    if inps.radar2geo:
+        ref_latlon = None
+        if 'REF_Y' in atr.keys():
+            ref_yx = (atr['REF_Y'], atr['REF_X'])
+            if ref_yx not in ref_latlon_cache:
+                coord = ut.coordinate(atr, lookup_file=inps.lookupFile)
+                ref_latlon_cache[ref_yx] = coord.radar2geo(np.array(int(ref_yx[0])),
+                                                           np.array(int(ref_yx[1])),
+                                                           print_msg=False)[0:2]
+            ref_latlon = ref_latlon_cache[ref_yx]
+        atr = attr.update_attribute4radar2geo(atr, res_obj=res_obj, ref_latlon=ref_latlon)
+    else:
+        atr = attr.update_attribute4geo2radar(atr, res_obj=res_obj)
+
+    # instantiate output file
+    hdf5_file = os.path.splitext(outfile)[1] in ['.h5', '.he5']
+    if hdf5_file:
+        # grab metadata from input file: dataset compression and UNIT
+        compression = readfile.get_hdf5_compression(infile)
+        ds_unit_dict = readfile.get_hdf5_dataset_attrs(infile, key='UNIT')
+        # initiate output file
+        writefile.layout_hdf5(
+            outfile,
+            metadata=atr,
+            ds_unit_dict=ds_unit_dict,
+            ref_file=infile,
+            compression=compression,
+        )
+    else:
+        dsDict = dict()
+
+    ## run
+    dsNames = readfile.get_dataset_list(infile, datasetName=inps.dset)
+    maxDigit = max(len(i) for i in dsNames)
+    for dsName in dsNames:
+
+        if not hdf5_file:
+            dsDict[dsName] = np.zeros((res_obj.length, res_obj.width), dtype=atr['DATA_TYPE'])
+
+        # number of bands for 3D datasets in HDF5 files (0 for 2D datasets)
+        # --> stream 3D datasets band-by-band to cap the peak memory at one 2D slab
+        num_band = 0
+        if hdf5_file:
+            with readfile.open_hdf5_dataset(infile, dsName) as ds:
+                if ds is not None and ds.ndim == 3:
+                    num_band = ds.shape[0]
+
+        # loop for block-by-block IO
+        for i in range(res_obj.num_box):
+            src_box = res_obj.src_box_list[i]
+            dest_box = res_obj.dest_box_list[i]
+
+            # read
+            print('-'*50 + f'{i+1}/{res_obj.num_box}')
+            print('reading {d:<{w}} in block {b} from {f} ...'.format(
+                d=dsName, w=maxDigit, b=src_box, f=os.path.basename(infile)))
+
+            # band-by-band IO for 3D datasets:
+            # read / resample / write one band at a time, so that neither the full
+            # source cube nor the full resampled cube is ever resident in memory
+            if num_band > 0:
+                print(f'streaming {num_band} bands to file: {outfile}')
+                with readfile.open_hdf5_dataset(infile, dsName) as ds:
+                    for j in range(num_band):
+                        data = ds[j, src_box[1]:src_box[3], src_box[0]:src_box[2]]
+                        # resampling is memory-bound: use single precision unless the
+                        # file is explicitly in double precision, to halve the bytes
+                        # moved through the gather / weighted-sum kernels
+                        if data.dtype == np.float64 and atr.get('DATA_TYPE', 'float32') != 'float64':
+                            data = data.astype(np.float32, copy=False)
+                        # reuse_buffer is safe here: each band is written to file
+                        # below before the next run_resample() call
+                        data = res_obj.run_resample(src_data=data, box_ind=i,
+                                                    print_msg=(j == 0), reuse_buffer=True)
+                        block = [j, j + 1,
+                                 dest_box[1], dest_box[3],
+                                 dest_box[0], dest_box[2]]
+                        writefile.write_hdf5_block(outfile,
+                                                   data=data,
+                                                   datasetName=dsName,
+                                                   block=block,
+                                                   print_msg=False)
+                continue
+
+            data = readfile.read(infile,
+                                 datasetName=dsName,
+                                 box=src_box,
+                                 print_msg=False)[0]
+
+            # resampling is memory-bound: use single precision unless the file is
+            # explicitly in double precision, to halve the bytes moved through the
+            # gather / weighted-sum kernels
+            if data.dtype == np.float64 and atr.get('DATA_TYPE', 'float32') != 'float64':
+                data = data.astype(np.float32, copy=False)
+
+            # resample
+            # reuse_buffer is safe here: each block is written to file / copied
+            # into dsDict below before the next run_resample() call
+            data = res_obj.run_resample(src_data=data, box_ind=i, reuse_buffer=True)
+
+            # write / save block data
+            if data.ndim == 3:
+                block = [0, data.shape[0],
+                         dest_box[1], dest_box[3],
+                         dest_box[0], dest_box[2]]
+            else:
+                block = [dest_box[1], dest_box[3],
+                         dest_box[0], dest_box[2]]
+
+            if hdf5_file:
+                print(f'write data in block {block} to file: {outfile}')
+                writefile.write_hdf5_block(outfile,
+                                           data=data,
+                                           datasetName=dsName,
+                                           block=block,
+                                           print_msg=False)
+            else:
+                dsDict[dsName][block[0]:block[1],
+                               block[2]:block[3]] = data
+
+        # for binary file: ensure same data type
+        if not hdf5_file:
+            dsDict[dsName] = np.array(dsDict[dsName], dtype=data.dtype)
+
+    # write binary file
+    if not hdf5_file:
+        atr['BANDS'] = len(dsDict.keys())
+        writefile.write(dsDict, out_file=outfile, metadata=atr, ref_file=infile)
+
+        # create ISCE XML and GDAL VRT file if using ISCE lookup table file
+        if inps.latFile and inps.lonFile:
+            writefile.write_isce_xml(atr, fname=outfile)
+
+    return outfile
+
+
 def run_geocode(inps):
     """geocode all input files"""
     start_time = time.time()
@@ -46,6 +232,7 @@ def run_geocode(inps):
                   nprocs=inps.nprocs,
                   max_memory=inps.maxMemory,
                   software=inps.software,
+                  use_gpu=getattr(inps, 'gpu', False),
                   print_msg=True)
     if inps.latFile and inps.lonFile:
         kwargs['lat_file'] = inps.latFile
@@ -58,100 +245,27 @@ def run_geocode(inps):
     res_obj.open()
     res_obj.prepare()
 
-    # resample input files one by one
-    for infile in inps.file:
-        print('-' * 50+f'\nresampling file: {infile}')
-        atr = readfile.read_attribute(infile, datasetName=inps.dset)
-        outfile = auto_output_filename(infile, inps)
-
-        # update_mode
-        if inps.updateMode:
-            print('update mode: ON')
-            if ut.run_or_skip(outfile, in_file=[infile, inps.lookupFile]) == 'skip':
-                continue
-
-        ## prepare output
-        # update metadata
-        if inps.radar2geo:
-            atr = attr.update_attribute4radar2geo(atr, res_obj=res_obj)
-        else:
-            atr = attr.update_attribute4geo2radar(atr, res_obj=res_obj)
-
-        # instantiate output file
-        hdf5_file = os.path.splitext(outfile)[1] in ['.h5', '.he5']
-        if hdf5_file:
-            # grab metadata from input file: dataset compression and UNIT
-            compression = readfile.get_hdf5_compression(infile)
-            ds_unit_dict = readfile.get_hdf5_dataset_attrs(infile, key='UNIT')
-            # initiate output file
-            writefile.layout_hdf5(
-                outfile,
-                metadata=atr,
-                ds_unit_dict=ds_unit_dict,
-                ref_file=infile,
-                compression=compression,
-            )
-        else:
-            dsDict = dict()
-
-        ## run
-        dsNames = readfile.get_dataset_list(infile, datasetName=inps.dset)
-        maxDigit = max(len(i) for i in dsNames)
-        for dsName in dsNames:
-
-            if not hdf5_file:
-                dsDict[dsName] = np.zeros((res_obj.length, res_obj.width), dtype=atr['DATA_TYPE'])
-
-            # loop for block-by-block IO
-            for i in range(res_obj.num_box):
-                src_box = res_obj.src_box_list[i]
-                dest_box = res_obj.dest_box_list[i]
-
-                # read
-                print('-'*50 + f'{i+1}/{res_obj.num_box}')
-                print('reading {d:<{w}} in block {b} from {f} ...'.format(
-                    d=dsName, w=maxDigit, b=src_box, f=os.path.basename(infile)))
-
-                data = readfile.read(infile,
-                                     datasetName=dsName,
-                                     box=src_box,
-                                     print_msg=False)[0]
-
-                # resample
-                data = res_obj.run_resample(src_data=data, box_ind=i)
-
-                # write / save block data
-                if data.ndim == 3:
-                    block = [0, data.shape[0],
-                             dest_box[1], dest_box[3],
-                             dest_box[0], dest_box[2]]
-                else:
-                    block = [dest_box[1], dest_box[3],
-                             dest_box[0], dest_box[2]]
-
-                if hdf5_file:
-                    print(f'write data in block {block} to file: {outfile}')
-                    writefile.write_hdf5_block(outfile,
-                                               data=data,
-                                               datasetName=dsName,
-                                               block=block,
-                                               print_msg=False)
-                else:
-                    dsDict[dsName][block[0]:block[1],
-                                   block[2]:block[3]] = data
-
-            # for binary file: ensure same data type
-            if not hdf5_file:
-                dsDict[dsName] = np.array(dsDict[dsName], dtype=data.dtype)
-
-        # write binary file
-        if not hdf5_file:
-            atr['BANDS'] = len(dsDict.keys())
-            writefile.write(dsDict, out_file=outfile, metadata=atr, ref_file=infile)
+    # cache of the REF_Y/X --> REF_LAT/LON conversion, which reads the lookup table
+    # file: compute it once and reuse it for all input files sharing the same
+    # reference pixel, instead of re-reading the lookup table for every file
+    ref_latlon_cache = {}
 
-            # create ISCE XML and GDAL VRT file if using ISCE lookup table file
-            if inps.latFile and inps.lonFile:
-                writefile.write_isce_xml(atr, fname=outfile)
+    # resample input files: each file reads, resamples and writes independently,
+    # sharing the prepared index/weight tables on res_obj
+    # os.cpu_count() can return None on exotic platforms
+    num_worker = min(getattr(inps, 'numWorker', 1), len(inps.file), os.cpu_count() or 1)
+    if num_worker > 1:
+        # threads (not processes): the hot gather / weighted-sum kernels run in
+        # numpy / numba with the GIL released, and threads share the prepared
+        # index tables and kernel cache on res_obj without copying / pickling
+        print(f'geocoding {len(inps.file)} files in parallel using {num_worker} threads ...')
+        with ThreadPoolExecutor(max_workers=num_worker) as executor:
+            outfile = list(executor.map(
+                lambda infile: geocode_file(infile, inps, res_obj, ref_latlon_cache),
+                inps.file))[-1]
+    else:
+        for infile in inps.file:
+            outfile = geocode_file(infile, inps, res_obj, ref_latlon_cache)
 
     # used time
     m, s = divmod(time.time()-start_time, 60)
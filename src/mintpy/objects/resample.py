@@ -9,28 +9,102 @@
 
 
 import os
+import threading
 import warnings
 
 import h5py
 import numpy as np
 from scipy import ndimage
-from scipy.interpolate import RegularGridInterpolator
 
 with warnings.catch_warnings():
     warnings.simplefilter('ignore', UserWarning)
     import pyresample as pr
 
+# numba is optional: it speeds up the bilinear weighted-sum step,
+# with a pure numpy backup below for environments without it.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# cupy is optional: it offloads the resampling kernels to the GPU (use_gpu=True)
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
 from mintpy.constants import EARTH_RADIUS
 from mintpy.objects.cluster import split_box2sub_boxes
 from mintpy.utils import ptime, readfile, utils0 as ut
 
 
+def _bilinear_sample_numpy(data, index, t__, s__):
+    """4-neighbour weighted sum for bilinear resampling (numpy backup of the numba kernel).
+
+    Parameters: data  - 1D np.ndarray, valid source data values
+                index - 2D np.ndarray of int in size of (num_pixel, 4), indices into data
+                t/s__ - 1D np.ndarray of float in size of (num_pixel), fractional weights
+                        NaN for pixels without valid interpolation
+    Returns:    out   - 1D np.ndarray of float in size of (num_pixel), resampled values
+    """
+    p_1 = data[index[:, 0]]
+    p_2 = data[index[:, 1]]
+    p_3 = data[index[:, 2]]
+    p_4 = data[index[:, 3]]
+    return (p_1 * (1 - s__) * (1 - t__)
+            + p_2 * s__ * (1 - t__)
+            + p_3 * (1 - s__) * t__
+            + p_4 * s__ * t__)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, nogil=True, cache=True)
+    def _bilinear_sample_numba(data, index, t__, s__, out):
+        """4-neighbour weighted sum for bilinear resampling (parallel numba kernel).
+
+        Same math as _bilinear_sample_numpy(), but in a single parallel loop over the
+        output pixels, without the large intermediate arrays of the numpy version.
+        """
+        for i in prange(t__.size):
+            t_i = t__[i]
+            s_i = s__[i]
+            if np.isnan(t_i) or np.isnan(s_i):
+                out[i] = np.nan
+            else:
+                out[i] = (data[index[i, 0]] * (1 - s_i) * (1 - t_i)
+                          + data[index[i, 1]] * s_i * (1 - t_i)
+                          + data[index[i, 2]] * (1 - s_i) * t_i
+                          + data[index[i, 3]] * s_i * t_i)
+        return out
+
+
+def _warmup_bilinear_kernel(dtypes=(np.float32, np.float64)):
+    """Trigger the numba compilation of the bilinear kernel ahead of its first use.
+
+    numba compiles lazily on the first call per signature; with cache=True on the
+    kernel the compiled code is stored on disk, so the multi-second JIT warmup is
+    paid once per installation rather than once per run. Calling this during
+    prepare_resample_info() moves even that one-off compile out of the data hot
+    path, into the geometry preparation phase.
+    """
+    if njit is None:
+        return
+
+    index = np.zeros((1, 4), dtype=np.int64)
+    ts__ = np.zeros(1, dtype=np.float64)
+    for dtype in dtypes:
+        data = np.zeros(1, dtype=dtype)
+        out = np.empty(1, dtype=np.promote_types(dtype, np.float32))
+        _bilinear_sample_numba(data, index, ts__, ts__, out)
+    return
+
+
 class resample:
     """
     Geometry Definition objects for geocoding using:
     1) pyresample (http://pyresample.readthedocs.org)
-    2) scipy.interpolate.RegularGridInterpolator:
-       (https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.RegularGridInterpolator.html)
+    2) scipy.ndimage.map_coordinates:
+       (https://docs.scipy.org/doc/scipy/reference/generated/scipy.ndimage.map_coordinates.html)
 
     Example:
         from mintpy.objects.resample import resample
@@ -83,7 +157,8 @@ class resample:
     """
 
     def __init__(self, lut_file, src_file=None, SNWE=None, lalo_step=None, interp_method='nearest', fill_value=np.nan,
-                 nprocs=1, max_memory=0, software='pyresample', print_msg=True, lat_file=None, lon_file=None):
+                 nprocs=1, max_memory=0, software='pyresample', print_msg=True, lat_file=None, lon_file=None,
+                 use_gpu=False):
         """
         Parameters: lut_file      - str, path of lookup table file, containing datasets:
                                     latitude / longitude      for lut_file in radar-coord
@@ -102,6 +177,8 @@ class resample:
                     lat/lon_file  - str, path of the ISCE-2 lat/lon.rdr file
                                     To geocode file with ISCE-2 lookup table files directly,
                                     without using/loading geometry files in HDF5/MintPy format.
+                    use_gpu       - bool, run the resampling kernels on the GPU via cupy
+                                    (pyresample software only)
         """
         # input variables
         self.lut_file = lut_file
@@ -120,10 +197,27 @@ class resample:
         self.software = software
         self.print_msg = print_msg
 
+        self.use_gpu = use_gpu
+        if use_gpu and cp is None:
+            raise ImportError('Can not import cupy! Required for use_gpu=True.')
+
         # initial variables
         self.num_box = 1
         self.radius = None
 
+        # cache of specialized resampling kernels, keyed by (box_ind, ndim, dtype, fill_value)
+        self._kernel_cache = {}
+
+        # per-thread cache of reusable output buffers, keyed by (shape, dtype)
+        self._buf_local = threading.local()
+
+        # cache of index / weight tables uploaded to the GPU, keyed by box_ind
+        self._gpu_table_cache = {}
+
+        # guard the lazy index / weight table build under the threaded
+        # multi-file loop in geocode.py
+        self._table_lock = threading.Lock()
+
 
     def open(self):
         """Read metadata
@@ -175,14 +269,25 @@ class resample:
             # aux info
             self.radius = self.get_radius_of_influence(self.lalo_step, self.src_meta)
 
+            # the resampling index / weight tables are built lazily on the first
+            # run_resample() call, so runs that end up resampling nothing, e.g.
+            # --update with all outputs up to date, never pay the kd-tree cost
 
-    def run_resample(self, src_data, box_ind=0, print_msg=True):
+
+    def run_resample(self, src_data, box_ind=0, print_msg=True, reuse_buffer=False):
         """Run interpolation operation for input 2D/3D data
-        Parameters: src_data   - 2D/3D np.array, source data to be resampled
-                    box_ind    - int, index of the current box of interest
-                                 for multiple boxes with pyresample only
-                    print_msg  - bool
-        Returns:    dest_data  - 2D/3D np.array, resampled data
+        Parameters: src_data     - 2D/3D np.array, source data to be resampled
+                    box_ind      - int, index of the current box of interest
+                                   for multiple boxes with pyresample only
+                    print_msg    - bool
+                    reuse_buffer - bool, recycle the output array across same-shape
+                                   calls from the same thread, to skip one large
+                                   allocation per band / block / file.
+                                   ONLY enable when each result is fully consumed
+                                   (e.g. written to file) before the next call, as
+                                   in the streaming loop of geocode.py; results
+                                   from consecutive calls alias each other.
+        Returns:    dest_data    - 2D/3D np.array, resampled data
         """
         vprint = print if print_msg else lambda *args, **kwargs: None
 
@@ -205,27 +310,48 @@ class resample:
         )
 
         if self.software == 'pyresample':
-            # move 1st/time dimension to the last
-            # so that rows/cols axis are the frist, as required by pyresample
-            if len(src_data.shape) == 3:
-                src_data = np.moveaxis(src_data, 0, -1)
+            # build the index / weight tables on first use (geometry-only cost,
+            # shared by all boxes / datasets / files of the run)
+            if getattr(self, 'resample_info_list', None) is None:
+                with self._table_lock:
+                    if getattr(self, 'resample_info_list', None) is None:
+                        self.prepare_resample_info()
 
             # resample source data into target data
-            dest_data = self.run_pyresample(
-                src_data=src_data,
-                src_def=self.src_def_list[box_ind],
-                dest_def=self.dest_def_list[box_ind],
-                radius=self.radius,
-                nprocs=self.nprocs,
-                **kwargs,
-            )
+            if getattr(self, 'resample_info_list', None):
+                # preferred: reuse the index / weight tables from prepare_resample_info()
+                # the cached kernels gather along the flattened rows/cols axes, so they
+                # operate on bands-first arrays natively, without the two cube-sized
+                # np.moveaxis copies required by the pyresample API
+                dest_data = self.run_pyresample_cached(
+                    src_data=src_data,
+                    box_ind=box_ind,
+                    fill_value=fill_value,
+                    print_msg=print_msg,
+                    reuse_buffer=reuse_buffer,
+                )
+            else:
+                # backup: one-off resampling without cached tables
+                # move 1st/time dimension to the last
+                # so that rows/cols axis are the frist, as required by pyresample
+                if len(src_data.shape) == 3:
+                    src_data = np.moveaxis(src_data, 0, -1)
+
+                dest_data = self.run_pyresample(
+                    src_data=src_data,
+                    src_def=self.src_def_list[box_ind],
+                    dest_def=self.dest_def_list[box_ind],
+                    radius=self.radius,
+                    nprocs=self.nprocs,
+                    **kwargs,
+                )
 
-            # move 1st/time dimension back
-            if len(dest_data.shape) == 3:
-                dest_data = np.moveaxis(dest_data, -1, 0)
+                # move 1st/time dimension back
+                if len(dest_data.shape) == 3:
+                    dest_data = np.moveaxis(dest_data, -1, 0)
 
         else:
-            vprint(f'{self.interp_method} resampling using scipy.interpolate.RegularGridInterpolator ...')
+            vprint(f'{self.interp_method} resampling using scipy.ndimage.map_coordinates ...')
             if len(src_data.shape) == 3:
                 dest_data = np.empty((src_data.shape[0], self.length, self.width), src_data.dtype)
                 prog_bar = ptime.progressBar(maxValue=src_data.shape[0], print_msg=print_msg)
@@ -504,11 +630,18 @@ class resample:
                 print(msg)
 
                 # geometry definition
+                # cast to C-contiguous float32 once: halves the bytes pulled through
+                # the kd-tree build (np.mgrid and the sliced views are float64 and/or
+                # non-contiguous), and float32 precision (~1e-5 deg, i.e. ~1 m) is
+                # well below the pixel size of InSAR geocoding
                 src_def = pr.geometry.SwathDefinition(
-                    lons=lut_lon[src_box[1]:src_box[3], src_box[0]:src_box[2]],
-                    lats=lut_lat[src_box[1]:src_box[3], src_box[0]:src_box[2]],
+                    lons=np.ascontiguousarray(lut_lon[src_box[1]:src_box[3], src_box[0]:src_box[2]], np.float32),
+                    lats=np.ascontiguousarray(lut_lat[src_box[1]:src_box[3], src_box[0]:src_box[2]], np.float32),
+                )
+                dest_def = pr.geometry.GridDefinition(
+                    lons=np.ascontiguousarray(dest_lon, np.float32),
+                    lats=np.ascontiguousarray(dest_lat, np.float32),
                 )
-                dest_def = pr.geometry.GridDefinition(lons=dest_lon, lats=dest_lat)
 
                 self.src_box_list.append(src_box)
                 self.src_def_list.append(src_def)
@@ -556,8 +689,11 @@ class resample:
                                         src_lon0:src_lon1:src_wid*1j]
 
             # parameter 4 - list of boxes & geometry definitions
+            # cast the float64 np.mgrid output to C-contiguous float32 (see above)
             self.src_box_list = [src_box]
-            self.src_def_list = [pr.geometry.GridDefinition(lons=src_lon, lats=src_lat)]
+            self.src_def_list = [pr.geometry.GridDefinition(
+                lons=np.ascontiguousarray(src_lon, np.float32),
+                lats=np.ascontiguousarray(src_lat, np.float32))]
             self.dest_box_list = [(0, 0, self.width, self.length)]
             self.dest_def_list = [pr.geometry.SwathDefinition(lons=lut_lon, lats=lut_lat)]
             self.num_box = 1
@@ -651,16 +787,34 @@ class resample:
             laloScale = ((commSNWE[0] - commSNWE[1]) / src_len,
                          (commSNWE[3] - commSNWE[2]) / src_wid)
 
+            # direct nearest-neighbour index table:
+            # azimuthCoord / rangeCoord give the source pixel location of each output
+            # pixel directly, so the flat index table is built in one vectorized pass
+            # over the lookup table - no kd-tree construction needed (see
+            # prepare_resample_info). The int cast floors the 0.5-based pixel-center
+            # coordinates; out-of-coverage pixels are flagged by the fill mask and
+            # only clipped here to keep the cast indices in-bound.
+            near_y = np.clip(dest_y.astype(np.int64), 0, src_len - 1)
+            near_x = np.clip(dest_x.astype(np.int64), 0, src_wid - 1)
+            self.direct_flat_index = (near_y * src_wid + near_x).ravel()
+            self.direct_fill_mask = ~commMask.ravel()
+
             src_lat, src_lon = project_yx2lalo(src_y, src_x, commSNWE, laloScale)
             dest_y[dest_y == 0.] = np.nan
             dest_x[dest_x == 0.] = np.nan
             dest_lat, dest_lon = project_yx2lalo(dest_y, dest_x, commSNWE, laloScale)
 
             # src_def and dest_def
+            # cast to C-contiguous float32 once to halve the bytes pulled through
+            # the kd-tree build; the scaled pseudo lat/lon do not need float64
             self.src_box_list = [(0, 0, src_wid, src_len)]
-            self.src_def_list = [pr.geometry.GridDefinition(lons=src_lon, lats=src_lat)]
+            self.src_def_list = [pr.geometry.GridDefinition(
+                lons=np.ascontiguousarray(src_lon, np.float32),
+                lats=np.ascontiguousarray(src_lat, np.float32))]
             self.dest_box_list = [dest_box]
-            self.dest_def_list = [pr.geometry.SwathDefinition(lons=dest_lon, lats=dest_lat)]
+            self.dest_def_list = [pr.geometry.SwathDefinition(
+                lons=np.ascontiguousarray(dest_lon, np.float32),
+                lats=np.ascontiguousarray(dest_lat, np.float32))]
             self.num_box = 1
 
 
@@ -697,6 +851,326 @@ class resample:
         return
 
 
+    def prepare_resample_info(self):
+        """Pre-compute the resampling index / weight tables for all boxes.
+
+        The kd-tree construction and neighbour query in pyresample depend on the
+        source / destination geometry only, NOT on the data values. Computing them
+        once here allows run_resample() to reuse the tables for every dataset and
+        every file sharing the same geometry, instead of re-building the kd-tree
+        for each call.
+        """
+        # build into a local list and publish in one assignment at the end,
+        # so concurrent run_resample() callers never see a partial table list
+        resample_info_list = []
+
+        # compile the numba bilinear kernel (if numba is available) while preparing
+        # the tables, so that run_resample() never pays the JIT compile cost; with
+        # cache=True on the kernel, subsequent runs load the compiled code from disk
+        if not self.interp_method.startswith('near') and not self.use_gpu:
+            _warmup_bilinear_kernel()
+
+        for i in range(self.num_box):
+            src_def = self.src_def_list[i]
+            dest_def = self.dest_def_list[i]
+
+            # get number of segments
+            num_segment = int(np.ceil(dest_def.size / 1e6 + 0.5))
+
+            if self.interp_method.startswith('near'):
+                # fast path for lookup tables in geo-coordinates (gamma / roipac):
+                # the source pixel of each output pixel is known directly from the
+                # lookup table, so the index table built in one vectorized pass in
+                # prepare_geometry_definition_geo() is used as-is, skipping the
+                # kd-tree construction altogether
+                if getattr(self, 'direct_flat_index', None) is not None:
+                    print(f'[{i+1}/{self.num_box}] using the nearest neighbour index table '
+                          'built directly from the lookup table ...')
+                    resample_info_list.append({
+                        'flat_index' : self.direct_flat_index,
+                        'fill_mask'  : self.direct_fill_mask,
+                    })
+                    continue
+
+                msg = f'[{i+1}/{self.num_box}] computing nearest neighbour index table '
+                msg += f'with pyresample.kd_tree using {self.nprocs} CPU cores in {num_segment} segments ...'
+                print(msg)
+                (valid_input_index,
+                 valid_output_index,
+                 index_array,
+                 distance_array) = pr.kd_tree.get_neighbour_info(
+                    src_def,
+                    dest_def,
+                    radius_of_influence=self.radius,
+                    neighbours=1,
+                    epsilon=0.5,
+                    nprocs=self.nprocs,
+                    segments=num_segment,
+                )
+
+                # convert the neighbour info into a flat source index + fill mask over
+                # the full destination grid, so that the nearest resampling reduces to
+                # a single C-level fancy-index gather in run_pyresample_cached()
+                valid_src_index = np.where(valid_input_index.ravel())[0]
+                no_neighbour = index_array >= valid_src_index.size
+                index_array[no_neighbour] = 0
+
+                flat_index = np.zeros(dest_def.size, dtype=np.int64)
+                fill_mask = np.ones(dest_def.size, dtype=np.bool_)
+                flat_index[valid_output_index] = valid_src_index[index_array]
+                fill_mask[valid_output_index] = no_neighbour
+
+                info = {
+                    'flat_index' : flat_index,
+                    'fill_mask'  : fill_mask,
+                }
+
+            else:
+                msg = f'[{i+1}/{self.num_box}] computing bilinear index / weight table '
+                msg += f'with pyresample.bilinear using {self.nprocs} CPU cores ...'
+                print(msg)
+                t__, s__, input_idxs, idx_ref = pr.bilinear.get_bil_info(
+                    src_def,
+                    dest_def,
+                    radius=self.radius,
+                    neighbours=32,
+                    nprocs=self.nprocs,
+                    masked=False,
+                )
+
+                # clamp indices of the invalid pixels (flagged by NaN in t/s)
+                # to keep the gather kernels in-bound
+                num_valid = np.count_nonzero(input_idxs)
+                idx_ref = np.clip(idx_ref, 0, max(num_valid - 1, 0))
+
+                info = {
+                    't'          : t__,
+                    's'          : s__,
+                    'input_idxs' : input_idxs,
+                    'idx_ref'    : idx_ref,
+                }
+
+            resample_info_list.append(info)
+
+        self.resample_info_list = resample_info_list
+
+        return
+
+
+    def run_pyresample_cached(self, src_data, box_ind=0, fill_value=np.nan, print_msg=True,
+                              reuse_buffer=False):
+        """Resample input src_data using the pre-computed index / weight tables.
+
+        This is the data-only step of the pyresample workflow: the geometry-dependent
+        kd-tree query is done once in prepare_resample_info(), so this function only
+        gathers / combines the source pixel values.
+
+        Parameters: src_data     - 2/3D np.ndarray, source data to be resampled
+                                   with the band axis first for 3D data (MintPy convention)
+                    box_ind      - int, index of the current box of interest
+                    fill_value   - number, fill value for extrapolation
+                    reuse_buffer - bool, write into an internal per-thread buffer
+                                   recycled across same-shape calls; the result is
+                                   then valid only until the next call from the same
+                                   thread (see run_resample).
+        Returns:    dest_data    - 2/3D np.ndarray, resampled data
+        """
+        if print_msg:
+            lib = 'numba' if njit is not None and not self.interp_method.startswith('near') else 'numpy'
+            print(f'{self.interp_method} resampling using the cached index/weight table via {lib} ...')
+
+        kernel = self._get_resample_kernel(box_ind, src_data.ndim, src_data.dtype, fill_value,
+                                           reuse_buffer=reuse_buffer)
+        return kernel(src_data)
+
+
+    def _get_out_buffer(self, shape, dtype):
+        """Get a reusable output buffer of the given shape / data type.
+
+        Only used when the caller opted in via reuse_buffer=True, i.e. each result
+        is consumed (written to file) before the next call, so the same buffer can
+        be recycled across same-shape calls - saving one large allocation +
+        zero/page-fault pass per band / block / file. Buffers are cached per thread
+        to stay safe under the threaded multi-file loop in geocode.py.
+        """
+        cache = getattr(self._buf_local, 'cache', None)
+        if cache is None:
+            cache = self._buf_local.cache = {}
+
+        key = (shape, str(dtype))
+        buf = cache.get(key, None)
+        if buf is None:
+            buf = cache[key] = np.empty(shape, dtype)
+        return buf
+
+
+    def _get_resample_kernel(self, box_ind, ndim, dtype, fill_value, reuse_buffer=False):
+        """Build (or fetch from cache) a resampling kernel specialized at runtime.
+
+        The method-selection branching, index/weight table lookups and fill-value
+        handling depend only on (box_ind, ndim, dtype, fill_value), which is constant
+        across all datasets / files of a geocoding run; resolve them once here and
+        return a closure that performs the data-only gather / weighted-sum step.
+
+        Parameters: box_ind      - int, index of the current box of interest
+                    ndim         - int, number of dimensions of the source data
+                    dtype        - np.dtype, data type of the source data
+                    fill_value   - number, fill value for extrapolation
+                    reuse_buffer - bool, write into a recycled per-thread buffer
+                                   instead of a fresh array (see run_resample)
+        Returns:    kernel       - function, src_data (2/3D np.ndarray) -> dest_data
+        """
+        key = (box_ind, ndim, str(dtype), fill_value, reuse_buffer)
+        kernel = self._kernel_cache.get(key, None)
+        if kernel is not None:
+            return kernel
+
+        if self.use_gpu:
+            kernel = self._get_resample_kernel_gpu(box_ind, ndim, dtype, fill_value)
+            self._kernel_cache[key] = kernel
+            return kernel
+
+        if reuse_buffer:
+            get_out_buffer = self._get_out_buffer
+        else:
+            # fresh output array per call: results from consecutive calls must
+            # not alias each other for the general callers, e.g. plate_motion.py
+            # resampling and keeping the east/north/up components in turn
+            get_out_buffer = np.empty
+
+        info = self.resample_info_list[box_ind]
+        dest_shape = self.dest_def_list[box_ind].shape
+
+        if self.interp_method.startswith('near'):
+            flat_index = info['flat_index']
+            fill_mask = info['fill_mask']
+
+            # NaN-heavy float layers (masked coherence / velocity): source pixels that
+            # are NaN produce NaN outputs anyway, so merge them into the fill mask via
+            # a cheap boolean gather (1 byte/pixel) and run the full-width data gather
+            # over the valid outputs only
+            nan_fill = (np.issubdtype(np.dtype(dtype), np.floating)
+                        and isinstance(fill_value, float) and np.isnan(fill_value))
+
+            if ndim == 3:
+                def kernel(src_data):
+                    num_band = src_data.shape[0]
+                    dest_data = get_out_buffer((num_band, flat_index.size), src_data.dtype)
+                    np.take(src_data.reshape(num_band, -1), flat_index, axis=1, out=dest_data)
+                    dest_data[:, fill_mask] = fill_value
+                    return dest_data.reshape(num_band, *dest_shape)
+            elif nan_fill:
+                def kernel(src_data):
+                    src_1d = src_data.ravel()
+                    invalid = fill_mask | np.isnan(src_1d)[flat_index]
+                    dest_data = get_out_buffer((flat_index.size,), src_data.dtype)
+                    dest_data.fill(fill_value)
+                    valid = ~invalid
+                    dest_data[valid] = src_1d[flat_index[valid]]
+                    return dest_data.reshape(dest_shape)
+            else:
+                def kernel(src_data):
+                    dest_data = get_out_buffer((flat_index.size,), src_data.dtype)
+                    np.take(src_data.ravel(), flat_index, out=dest_data)
+                    dest_data[fill_mask] = fill_value
+                    return dest_data.reshape(dest_shape)
+
+        else:
+            t__ = info['t']
+            s__ = info['s']
+            input_idxs = info['input_idxs']
+            idx_ref = info['idx_ref']
+            out_dtype = np.promote_types(dtype, np.float32)
+
+            def sample_one_band(band):
+                """Resample one 2D band via the 4-neighbour weighted-sum kernel."""
+                data_1d = band.ravel()[input_idxs]
+                if njit is not None:
+                    out = get_out_buffer((t__.size,), out_dtype)
+                    _bilinear_sample_numba(data_1d, idx_ref, t__, s__, out)
+                else:
+                    out = _bilinear_sample_numpy(data_1d, idx_ref, t__, s__)
+
+                # fill the non-interpolated pixels, as in pyresample.bilinear.resample_bilinear()
+                if not np.isnan(fill_value):
+                    out[np.isnan(out)] = fill_value
+                return out.reshape(dest_shape)
+
+            # the weighted-sum kernel supports 2D matrix only --> loop over the band axis
+            if ndim == 3:
+                def kernel(src_data):
+                    num_band = src_data.shape[0]
+                    dest_data = get_out_buffer((num_band, *dest_shape), out_dtype)
+                    for i in range(num_band):
+                        dest_data[i] = sample_one_band(src_data[i])
+                    return dest_data
+            else:
+                kernel = sample_one_band
+
+        self._kernel_cache[key] = kernel
+        return kernel
+
+
+    def _get_resample_kernel_gpu(self, box_ind, ndim, dtype, fill_value):
+        """GPU (cupy) counterpart of _get_resample_kernel().
+
+        The index / weight tables are uploaded to the device once per box; each call
+        then only moves the source data in and the resampled result out, with the
+        gather / weighted-sum running on the GPU. The per-pixel work is independent
+        across output pixels, which maps well onto the device for large output grids.
+        """
+        tables = self._gpu_table_cache.get(box_ind, None)
+        if tables is None:
+            tables = {key: cp.asarray(value)
+                      for key, value in self.resample_info_list[box_ind].items()}
+            self._gpu_table_cache[box_ind] = tables
+
+        dest_shape = self.dest_def_list[box_ind].shape
+
+        if self.interp_method.startswith('near'):
+            flat_index = tables['flat_index']
+            fill_mask = tables['fill_mask']
+
+            if ndim == 3:
+                def kernel(src_data):
+                    num_band = src_data.shape[0]
+                    d_dest = cp.asarray(src_data).reshape(num_band, -1)[:, flat_index]
+                    d_dest[:, fill_mask] = fill_value
+                    return cp.asnumpy(d_dest.reshape(num_band, *dest_shape))
+            else:
+                def kernel(src_data):
+                    d_dest = cp.asarray(src_data).ravel()[flat_index]
+                    d_dest[fill_mask] = fill_value
+                    return cp.asnumpy(d_dest.reshape(dest_shape))
+
+        else:
+            t__ = tables['t']
+            s__ = tables['s']
+            input_idxs = tables['input_idxs']
+            idx_ref = tables['idx_ref']
+            out_dtype = np.promote_types(dtype, np.float32)
+
+            def sample_one_band(band):
+                d_data = cp.asarray(band).ravel()[input_idxs]
+                # _bilinear_sample_numpy() is pure array arithmetic --> works on cupy arrays
+                d_out = _bilinear_sample_numpy(d_data, idx_ref, t__, s__)
+                if not np.isnan(fill_value):
+                    d_out[cp.isnan(d_out)] = fill_value
+                return cp.asnumpy(d_out.reshape(dest_shape))
+
+            if ndim == 3:
+                def kernel(src_data):
+                    num_band = src_data.shape[0]
+                    dest_data = np.empty((num_band, *dest_shape), out_dtype)
+                    for i in range(num_band):
+                        dest_data[i] = sample_one_band(src_data[i])
+                    return dest_data
+            else:
+                kernel = sample_one_band
+
+        return kernel
+
+
     @staticmethod
     def run_pyresample(src_data, src_def, dest_def, radius, interp_method='nearest', fill_value=np.nan,
                        nprocs=1, print_msg=True):
@@ -772,15 +1246,13 @@ class resample:
     ##------------------------------ resample using scipy.interpolate ------------------------------##
 
     def prepare_regular_grid_interpolator(self):
-        """Prepare aux data for RegularGridInterpolator module"""
+        """Prepare aux data for the map_coordinates-based interpolation"""
 
         # radar2geo
         if 'Y_FIRST' not in self.src_meta.keys():
-            # source points in regular grid
+            # source grid shape
             src_len = int(self.src_meta['LENGTH'])
             src_wid = int(self.src_meta['WIDTH'])
-            self.src_pts = (np.arange(src_len) + 0.5,
-                            np.arange(src_wid) + 0.5)
 
             # destination points
             dest_y = readfile.read(self.lut_file, datasetName='azimuthCoord')[0]
@@ -791,8 +1263,12 @@ class resample:
                 dest_x[dest_x != 0.] -= float(self.src_meta['SUBSET_XMIN'])
             self.interp_mask = np.multiply(np.multiply(dest_y > 0, dest_y < src_len),
                                            np.multiply(dest_x > 0, dest_x < src_wid))
-            self.dest_pts = np.hstack((dest_y[self.interp_mask].reshape(-1, 1),
-                                       dest_x[self.interp_mask].reshape(-1, 1)))
+
+            # destination points in array-index coordinates for map_coordinates:
+            # shift the 0.5-based pixel-center coordinates of the lookup table onto
+            # the 0-based source array indices
+            self.dest_coord = np.vstack((dest_y[self.interp_mask] - 0.5,
+                                         dest_x[self.interp_mask] - 0.5))
 
             # parameter 1/2/3 - lalo_step / SNWE / length & width
             lat_num = int(self.lut_meta['LENGTH'])
@@ -824,21 +1300,27 @@ class resample:
 
 
     def run_regular_grid_interpolator(self, src_data, interp_method='nearest', fill_value=np.nan, print_msg=True):
-        """Interpolate 2D matrix"""
-        # prepare interpolation function
-        interp_func = RegularGridInterpolator(
-            self.src_pts,
-            src_data,
-            method=interp_method,
-            bounds_error=False,
-            fill_value=fill_value,
-        )
+        """Interpolate 2D matrix via scipy.ndimage.map_coordinates.
+
+        Same math as scipy.interpolate.RegularGridInterpolator on a regular source
+        grid, but the whole nearest / bilinear gather runs in one tight C loop with
+        internal bounds handling, instead of constructing an interpolator object and
+        several destination-sized temporaries per call.
+        """
+        order = 0 if interp_method == 'nearest' else 1
 
         # prepare output matrix
         geo_data = np.empty((self.length, self.width), src_data.dtype)
         geo_data.fill(fill_value)
 
         # interpolate output matrix
-        geo_data[self.interp_mask] = interp_func(self.dest_pts)
+        geo_data[self.interp_mask] = ndimage.map_coordinates(
+            src_data,
+            self.dest_coord,
+            order=order,
+            mode='constant',
+            cval=fill_value,
+            prefilter=False,
+        )
 
         return geo_data
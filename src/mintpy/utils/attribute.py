@@ -8,6 +8,7 @@
 #   from mintpy.utils import attribute as attr
 
 
+import math
 import warnings
 
 import numpy as np
@@ -144,7 +145,7 @@ def update_attribute4geo2radar(atr_in, shape2d=None, res_obj=None, print_msg=Tru
 
 
 def update_attribute4radar2geo(atr_in, shape2d=None, lalo_step=None, SNWE=None, lut_file=None,
-                               res_obj=None, print_msg=True):
+                               res_obj=None, ref_latlon=None, print_msg=True):
     """update input dictionary of attributes due to resampling from radar to geo coordinates
 
     Parameters: atr_in  - dict, input dictionary of attributes
@@ -155,6 +156,11 @@ def update_attribute4radar2geo(atr_in, shape2d=None, lalo_step=None, SNWE=None,
                 lut_file  - str, path of lookup table file
                 # combination 2
                 res_obj   - mintpy.objects.resample.resample object
+                # optional
+                ref_latlon - tuple of 2 float, lat/lon of the REF_Y/X pixel,
+                             pre-computed by the caller to avoid re-reading the
+                             lookup table file, e.g. for multiple input files
+                             sharing the same reference pixel
     Returns:    atr     - dict, updated dictionary of attributes
     """
     # make a copy of original meta dict
@@ -180,13 +186,20 @@ def update_attribute4radar2geo(atr_in, shape2d=None, lalo_step=None, SNWE=None,
 
     # Reference point from y/x to lat/lon
     if 'REF_Y' in atr.keys():
-        coord = coordinate(atr_in, lookup_file=lut_file)
-        ref_lat, ref_lon = coord.radar2geo(np.array(int(atr['REF_Y'])),
-                                           np.array(int(atr['REF_X'])),
-                                           print_msg=False)[0:2]
-        if ~np.isnan(ref_lat) and ~np.isnan(ref_lon):
-            ref_y = int(np.rint((ref_lat - float(atr['Y_FIRST'])) / float(atr['Y_STEP'])))
-            ref_x = int(np.rint((ref_lon - float(atr['X_FIRST'])) / float(atr['X_STEP'])))
+        if ref_latlon is not None:
+            ref_lat, ref_lon = ref_latlon
+        else:
+            coord = coordinate(atr_in, lookup_file=lut_file)
+            ref_lat, ref_lon = coord.radar2geo(np.array(int(atr['REF_Y'])),
+                                               np.array(int(atr['REF_X'])),
+                                               print_msg=False)[0:2]
+        ref_lat = float(ref_lat)
+        ref_lon = float(ref_lon)
+        if not (math.isnan(ref_lat) or math.isnan(ref_lon)):
+            # plain scalar arithmetic: SNWE / lalo_step are float already,
+            # no need to round-trip through the (str) metadata values and np.rint
+            ref_y = int(round((ref_lat - SNWE[1]) / lalo_step[0]))
+            ref_x = int(round((ref_lon - SNWE[2]) / lalo_step[1]))
             atr['REF_LAT'] = str(ref_lat)
             atr['REF_LON'] = str(ref_lon)
             atr['REF_Y'] = str(ref_y)
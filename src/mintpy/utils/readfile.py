@@ -15,6 +15,7 @@ import re
 import sys
 import warnings
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 
 import h5py
 import numpy as np
@@ -257,6 +258,26 @@ SPECIAL_STR2NUM = {
 
 
 #########################################################################
+@contextmanager
+def open_hdf5_dataset(fname, datasetName):
+    """Open one dataset in an HDF5 file for direct sliced access.
+
+    Unlike read(), which buffers the requested data into a full intermediate numpy
+    array, the yielded h5py.Dataset is indexed in place, so each slab read moves
+    data straight from the HDF5 chunk cache into the destination buffer. Useful to
+    stream large 3D datasets band-by-band without double-buffering the whole cube.
+
+    Parameters: fname       - str, path of the HDF5 file
+                datasetName - str, name of the dataset
+    Yields:     ds          - h5py.Dataset, or None if the dataset does not exist
+    Examples:   with readfile.open_hdf5_dataset('timeseries.h5', 'timeseries') as ds:
+                    for i in range(ds.shape[0]):
+                        data = ds[i, :, :]
+    """
+    with h5py.File(fname, 'r') as f:
+        yield f[datasetName] if datasetName in f else None
+
+
 def read(fname, box=None, datasetName=None, print_msg=True, xstep=1, ystep=1, data_type=None,
          no_data_values=None):
     """Read one dataset and its attributes from input file.
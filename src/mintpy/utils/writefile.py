@@ -17,6 +17,30 @@ import numpy as np
 from mintpy.utils import readfile
 
 
+def auto_chunk_size(shape, dtype, chunk_size=1024**2):
+    """Get the HDF5 chunk shape for a given dataset shape / data type.
+
+    Chunks are whole rows (and one band only along the leading axes of 3D+
+    datasets, matching the band-by-band read/write pattern of most routines),
+    sized toward the default 1 MB HDF5 chunk cache. This replaces the h5py
+    auto-guessed chunks (chunks=True), which can be arbitrarily mis-aligned
+    with the access pattern, e.g. splitting rows or grouping bands, and thus
+    slow down every downstream reader.
+
+    Parameters: shape      - tuple of int, dataset shape
+                dtype      - str / np.dtype, dataset data type
+                chunk_size - int, target chunk size in bytes
+    Returns:    chunks     - tuple of int (or True for 1D datasets), chunk shape
+    """
+    if len(shape) < 2:
+        return True
+
+    length, width = shape[-2:]
+    num_row = int(np.clip(chunk_size // (width * np.dtype(dtype).itemsize), 1, length))
+
+    return (1,) * (len(shape) - 2) + (num_row, width)
+
+
 def write(datasetDict, out_file, metadata=None, ref_file=None, compression=None, ds_unit_dict=None, print_msg=True):
     """ Write one file.
     Parameters: datasetDict  - dict of dataset, with key = datasetName and value = 2D/3D array, e.g.:
@@ -113,7 +137,7 @@ def write(datasetDict, out_file, metadata=None, ref_file=None, compression=None,
                                                        c=compression))
                 ds = f.create_dataset(dsName,
                                       data=data,
-                                      chunks=True,
+                                      chunks=auto_chunk_size(data.shape, data.dtype),
                                       compression=compression)
 
             # 2. Write extra/auxliary datasets from ref_file
@@ -364,7 +388,7 @@ def layout_hdf5(fname, ds_name_dict=None, metadata=None, ds_unit_dict=None, ref_
                                   shape=data_shape,
                                   maxshape=max_shape,
                                   dtype=data_type,
-                                  chunks=True,
+                                  chunks=auto_chunk_size(data_shape, data_type),
                                   compression=ds_comp)
 
             # write auxliary data